@@ -1,58 +1,178 @@
-from itertools import permutations, combinations
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import arxiv
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from helpers import escape_html
+
+# Page size used for the concurrent pagination of search results.
+_PAGE_SIZE = 100
+# Cap on concurrent page requests to stay polite towards the arXiv API.
+_MAX_CONCURRENT_PAGES = 3
+
+# Search results cached by (topics, date range, max_results) so repeated
+# queries for the same day (daily job, multiple /today calls) reuse one fetch.
+# Listings for past dates don't change, so historical ranges keep longer.
+_SEARCH_CACHE = {}
+_SEARCH_CACHE_TTL = 3600
+_SEARCH_CACHE_TTL_HISTORICAL = 86400
+
+# Shared client for by-id lookups. arxiv.Client already talks to
+# export.arxiv.org (the host intended for programmatic access); a shorter
+# delay is fine for the occasional single-page id queries.
+_ID_CLIENT = arxiv.Client(delay_seconds=1, num_retries=3)
+
+@lru_cache(maxsize=128)
+def _build_topic_query(topics) -> str:
+    """Build the OR-joined category query for a topic spec.
+
+    Takes a tuple of topics or a single (possibly comma-separated) string;
+    memoized since the bot issues the same topics on every call.
+    """
+    # Normalize to a sequence once: a lone string is just the single-entry
+    # case of the comma-separated form
+    if isinstance(topics, str):
+        topics = tuple(t.strip() for t in topics.split(','))
+    return " OR ".join(f"cat:{topic}" if "." in topic else topic for topic in topics)
+
+def _fetch_page(search: arxiv.Search, offset: int) -> list[arxiv.Result]:
+    """Fetch a single page of search results starting at the given offset."""
+    client = arxiv.Client(page_size=_PAGE_SIZE, delay_seconds=0)
+    return list(islice(client.results(search, offset=offset), _PAGE_SIZE))
+
+def _iter_search_results(search: arxiv.Search, max_results: int):
+    """Yield search results as they arrive, fetching pages concurrently.
+
+    Offsets are submitted one window at a time (never more than
+    _MAX_CONCURRENT_PAGES in flight), so a short page — meaning there are
+    no further results — stops the pagination without ever submitting the
+    remaining offsets.
+    """
+    offsets = iter(range(0, max_results, _PAGE_SIZE))
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_PAGES) as executor:
+        # Pages are consumed in offset order from the left of the window;
+        # each consumed page tops the window back up with the next offset
+        window = deque(executor.submit(_fetch_page, search, offset)
+                       for offset in islice(offsets, _MAX_CONCURRENT_PAGES))
+        while window:
+            page = window.popleft().result()
+            yield from page
+            if len(page) < _PAGE_SIZE:
+                for future in window:
+                    future.cancel()
+                break
+            for offset in islice(offsets, 1):
+                window.append(executor.submit(_fetch_page, search, offset))
 
 def fetch_arxiv_papers(topics, start_date: datetime, end_date: datetime, max_results=100) -> list[arxiv.Result]:
     """
     Fetch arXiv papers on specified topics within a given timeframe.
-    
+
     Args:
         topics (Union(str, list): List of arXiv categories or search terms
         start_date (datetime): Start date
         end_date (datetime): End date
         max_results (int): Maximum number of results to return
-    
+
     Returns:
         list: List of dictionaries containing paper details (title, abstract, link)
     """
-    
-    # Build the query string from topics
-    if isinstance(topics, list):
-        query = " OR ".join([f"cat:{topic}" if "." in topic else topic for topic in topics])
-    else:
-        # If topics is a string and contains commas, treat it as a list of topics
-        if ',' in topics:
-            topic_list = [t.strip() for t in topics.split(',')]
-            query = " OR ".join([f"cat:{topic}" if "." in topic else topic for topic in topic_list])
-        else:
-            query = f"cat:{topics}" if "." in topics else topics
-    
-    # Set up the search client
-    client = arxiv.Client()
-    
+
+    # Check the TTL cache before hitting the network
+    cache_key = (tuple(topics) if isinstance(topics, list) else topics,
+                 start_date.date(), end_date.date(), max_results)
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None and time.time() < cached[0]:
+        return cached[1]
+
+    # Build the query string from topics (memoized across calls)
+    query = _build_topic_query(cache_key[0])
+
+    # Restrict the submission date server-side so arXiv only returns
+    # in-range papers instead of filtering them client-side after download.
+    # arXiv interprets submittedDate in GMT, so aware inputs are converted
+    # to UTC first; naive inputs pass through unchanged as before.
+    clause_start = start_date.astimezone(timezone.utc) if start_date.tzinfo is not None else start_date
+    clause_end = end_date.astimezone(timezone.utc) if end_date.tzinfo is not None else end_date
+    date_clause = f"submittedDate:[{clause_start.strftime('%Y%m%d%H%M')} TO {clause_end.strftime('%Y%m%d%H%M')}]"
+    query = f"({query}) AND {date_clause}"
+
     # Create a search query
     search = arxiv.Search(
         query=query,
         max_results=max_results,
         sort_by=arxiv.SortCriterion.SubmittedDate
     )
-    
-    # Execute the search and filter by date
-    results = []
-    for paper in client.results(search):
-        published_date = paper.published
-        if start_date <= published_date.replace(tzinfo=None) <= end_date:
-            results.append(paper)
-    
+
+    # Stream the result pages; materialized here because both the TTL
+    # cache and the callers expect a reusable list.
+    results = list(_iter_search_results(search, max_results))
+
+    # datetime.now(end_date.tzinfo) stays naive for naive inputs and aware
+    # for aware ones, so the comparison is valid either way
+    ttl = _SEARCH_CACHE_TTL_HISTORICAL if end_date < datetime.now(end_date.tzinfo) - timedelta(days=1) else _SEARCH_CACHE_TTL
+
+    # Evict expired entries on insert so the cache can't grow without
+    # bound in a long-running process: each stale (topics, date range)
+    # key would otherwise pin up to a page of Result objects forever
+    now = time.time()
+    for key in [k for k, v in _SEARCH_CACHE.items() if v[0] <= now]:
+        del _SEARCH_CACHE[key]
+
+    _SEARCH_CACHE[cache_key] = (now + ttl, results)
     return results
 
+def _serialize_paper(paper: arxiv.Result) -> dict:
+    """Convert an arxiv.Result into the plain dict handed to callers.
+
+    HTML-escaped variants of the text fields are precomputed here so
+    renderers (and the lru_cache around by-id lookups) never re-escape
+    the same immutable metadata.
+    """
+    authors = [author.name for author in paper.authors]
+    return {
+        'title': paper.title,
+        'abstract': paper.summary,
+        'link': paper.pdf_url,
+        'published': paper.published.strftime('%Y-%m-%d'),
+        'authors': authors,
+        'id': paper.entry_id,
+        'categories': paper.categories,
+        'title_html': escape_html(paper.title),
+        'authors_html': escape_html(', '.join(authors)),
+        'abstract_html': escape_html(paper.summary),
+    }
+
+def fetch_papers_by_ids(paper_ids) -> list[dict]:
+    """
+    Fetch several arXiv papers in a single API request.
+
+    The API accepts many IDs per id_list query, so resolving a batch this
+    way costs one round-trip instead of one per paper.
+
+    Args:
+        paper_ids (list): arXiv paper IDs (e.g., ['2101.12345'])
+
+    Returns:
+        list: Paper detail dicts for the IDs that resolved
+    """
+    search = arxiv.Search(id_list=list(paper_ids), max_results=len(paper_ids))
+    return [_serialize_paper(paper) for paper in _ID_CLIENT.results(search)]
+
+@lru_cache(maxsize=2048)
 def fetch_paper_by_id(paper_id):
     """
     Fetch a single arXiv paper by its ID.
-    
+
+    Results are memoized: paper metadata is effectively immutable, so
+    repeated lookups of the same ID skip the network round-trip.
+
     Args:
         paper_id (str): arXiv paper ID (e.g., '2101.12345')
-    
+
     Returns:
         dict: Paper details or None if not found
     """
@@ -65,31 +185,13 @@ def fetch_paper_by_id(paper_id):
         paper_id = paper_id.split('abs/')[-1]
     if '.pdf' in paper_id:
         paper_id = paper_id.replace('.pdf', '')
-    
-    # Create search query for the specific paper
-    client = arxiv.Client()
-    search = arxiv.Search(id_list=[paper_id])
-    
-    # Get the paper
-    results = list(client.results(search))
-    
-    if not results:
-        return None
-    
-    paper = results[0]
-    return {
-        'title': paper.title,
-        'abstract': paper.summary,
-        'link': paper.pdf_url,
-        'published': paper.published.strftime('%Y-%m-%d'),
-        'authors': [author.name for author in paper.authors],
-        'id': paper.entry_id,
-        'categories': paper.categories
-    }
+
+    results = fetch_papers_by_ids([paper_id])
+    return results[0] if results else None
 
 
-if __name__ == "__main__":    
-    fetch_arxiv_papers("cs.CV", 
-                       datetime.strptime('2025-01-01', '%Y-%m-%d'), 
-                       datetime.strptime('2025-01-31', '%Y-%m-%d'), 
+if __name__ == "__main__":
+    fetch_arxiv_papers("cs.CV",
+                       datetime.strptime('2025-01-01', '%Y-%m-%d'),
+                       datetime.strptime('2025-01-31', '%Y-%m-%d'),
                        max_results=5)
@@ -1,96 +1,181 @@
+from operator import attrgetter
+
+# Telegram's hard per-message limit, and the chunking target that leaves
+# headroom below it for the joining newlines and fallback prefixes
+TELEGRAM_MAX_LEN = 4096
+CHUNK_TARGET = 4000
+
+# Translation table so escaping is a single pass instead of three
+# chained str.replace calls, each of which allocates a new string.
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# C-level accessor for the per-author name lookups in format_papers
+_author_name = attrgetter('name')
+
+
+def telegram_len(text):
+    """Length of text as Telegram counts it: UTF-16 code units.
+
+    Characters outside the BMP (most emoji) count as two units, so plain
+    len() undercounts against the 4096 limit. Encoding to UTF-16 is a
+    single C call; each code unit is two bytes.
+    """
+    return len(text.encode('utf-16-le')) // 2
+
+
+def fits_in_telegram_message(text):
+    """True when text fits one Telegram message (4096 UTF-16 units).
+
+    Every character is at least one and at most two units, so clearly
+    short or clearly long texts are decided by len() alone; only the
+    borderline band pays for the exact encode-based count.
+    """
+    if 2 * len(text) <= TELEGRAM_MAX_LEN:
+        return True
+    if len(text) > TELEGRAM_MAX_LEN:
+        return False
+    return telegram_len(text) <= TELEGRAM_MAX_LEN
+
+
 def escape_html(text):
     """Escape HTML special characters
-    
+
     Args:
         text: Text to escape
     """
     if not text:
         return ""
 
-    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return text.translate(_HTML_ESCAPE_TABLE)
 
 
 def paper_id_without_dot(paper_id: str) -> str:
-    if "." in paper_id:
-        return paper_id.replace(".", "")
-    else:
-        return paper_id
+    # str.replace is already a no-op single pass when there is no dot;
+    # the separate membership scan was redundant
+    return paper_id.replace(".", "")
 
 
 def paper_id_with_dot(paper_id: str) -> str:
+    # New-style IDs carry their dot at index 4, so a single char test
+    # covers the common case without scanning the whole ID
+    if len(paper_id) > 4 and paper_id[4] == ".":
+        return paper_id
     if "." in paper_id:
         return paper_id
-    else:
-        return paper_id[: 4] + "." + paper_id[4:]
+    return paper_id[: 4] + "." + paper_id[4:]
+
+def iter_html_chunks(message, max_length=CHUNK_TARGET):
+    """Yield chunks of a long HTML message without breaking HTML tags.
+
+    Generator form of chunk_html_message: callers that send chunks one by
+    one keep at most a single chunk alive alongside the source message.
 
-def chunk_html_message(message, max_length=4000):
-    """Split a long HTML message into chunks without breaking HTML tags.
-    
     Args:
         message (str): The HTML message to split
         max_length (int): Maximum length of each chunk
-        
-    Returns:
-        list: List of message chunks
+
+    Yields:
+        str: Message chunks
     """
     if len(message) <= max_length:
-        return [message]
-
-    chunks = []
-    current_chunk = ""
+        yield message
+        return
+
+    if len(message) <= 2 * max_length:
+        # Just-over case: one rfind cut replaces the full paragraph split,
+        # provided the remainder also fits in a single chunk
+        cut = message.rfind("\n\n", 0, max_length)
+        if cut > 0 and len(message) - cut - 2 <= max_length:
+            yield message[:cut]
+            yield message[cut + 2:]
+            return
+
+    if "\n\n" not in message:
+        # One oversized paragraph: skip the paragraph split entirely and
+        # cut on spaces until the remainder fits
+        rest = message
+        while len(rest) > max_length:
+            safe_length = rest.rfind(' ', 0, max_length) + 1
+            if safe_length <= 0:
+                safe_length = max_length
+            yield rest[:safe_length]
+            rest = rest[safe_length:]
+        if rest:
+            yield rest
+        return
+
+    # Paragraphs of the chunk being built, joined only when the chunk closes,
+    # so we never rebuild a growing accumulator string per paragraph.
+    buffer = []
+    buffer_len = 0
 
     # Simple approach: split on double newlines to keep paragraphs together
-    paragraphs = message.split("\n\n")
-
-    for paragraph in paragraphs:
+    for paragraph in message.split("\n\n"):
         # If adding this paragraph would exceed the limit, start a new chunk
-        if len(current_chunk) + len(paragraph) + 2 > max_length:
-            if current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = paragraph
-            else:
-                # If a single paragraph is too long, we need to split it
-                if len(paragraph) > max_length:
-                    # Try to split at a safe position like a space
+        if buffer_len + len(paragraph) + 2 > max_length:
+            if buffer:
+                yield "\n\n".join(buffer)
+                buffer = [paragraph] if paragraph else []
+                buffer_len = len(paragraph)
+            elif len(paragraph) > max_length:
+                # If a single paragraph is too long, we need to split it.
+                # Try to split at a safe position like a space.
+                safe_length = paragraph.rfind(' ', 0, max_length) + 1
+                if safe_length <= 0:
+                    # Worst case: just split at max_length
                     safe_length = max_length
-                    while safe_length > 0 and paragraph[safe_length - 1] != ' ':
-                        safe_length -= 1
-
-                    if safe_length > 0:
-                        chunks.append(paragraph[:safe_length])
-                        current_chunk = paragraph[safe_length:]
-                    else:
-                        # Worst case: just split at max_length
-                        chunks.append(paragraph[:max_length])
-                        current_chunk = paragraph[max_length:]
-                else:
-                    current_chunk = paragraph
-        else:
-            if current_chunk:
-                current_chunk += "\n\n" + paragraph
+                yield paragraph[:safe_length]
+                buffer = [paragraph[safe_length:]]
+                buffer_len = len(paragraph) - safe_length
             else:
-                current_chunk = paragraph
+                buffer = [paragraph]
+                buffer_len = len(paragraph)
+        elif buffer:
+            buffer.append(paragraph)
+            buffer_len += len(paragraph) + 2
+        elif paragraph:
+            buffer = [paragraph]
+            buffer_len = len(paragraph)
+
+    if buffer:
+        yield "\n\n".join(buffer)
+
+
+def chunk_html_message(message, max_length=CHUNK_TARGET):
+    """Split a long HTML message into chunks without breaking HTML tags.
+
+    Args:
+        message (str): The HTML message to split
+        max_length (int): Maximum length of each chunk
+
+    Returns:
+        list: List of message chunks
+    """
+    return list(iter_html_chunks(message, max_length))
+
+
+# One prebuilt entry template instead of several f-string builds per paper
+_PAPER_ENTRY_TMPL = ("{i}. <b>{title}</b>\n"
+                     "   Authors: {authors}\n"
+                     "   /abstract{pid}\n\n")
+
 
-    if current_chunk:
-        chunks.append(current_chunk)
+def _format_paper_entry(indexed):
+    """Render one numbered digest entry from an (index, paper) pair."""
+    i, paper = indexed
+    authors = ', '.join(map(_author_name, paper.authors[:3]))
+    if len(paper.authors) > 3:
+        authors += ' et al.'
 
-    return chunks
+    # rpartition takes just the tail without allocating the full split list
+    paper_id = paper.entry_id.rpartition('/')[2]
+    return _PAPER_ENTRY_TMPL.format(i=i,
+                                    title=escape_html(paper.title),
+                                    authors=escape_html(authors),
+                                    pid=paper_id_without_dot(paper_id))
 
 
 def format_papers(papers):
-    # Format and send results for each topic
-    message = f"📚 <b>Papers Today</b> 📚\n\n"
-    for i in range(len(papers)):
-        paper = papers[i]
-        title = escape_html(paper.title)
-        authors = ', '.join(author.name for author in paper.authors[:3])
-        if len(paper.authors) > 3:
-            authors += ' et al.'
-        authors = escape_html(authors)
-
-        message += f"{i}. <b>{title}</b>\n"
-        message += f"   Authors: {authors}\n"
-
-        paper_id = paper.entry_id.split('/')[-1]  # Extract just the ID part
-        message += f"   /abstract{paper_id_without_dot(paper_id)}\n\n"
-    return message
\ No newline at end of file
+    # One join over a mapped formatter instead of growing the message
+    # string (or an explicit accumulator loop) per paper
+    return "📚 <b>Papers Today</b> 📚\n\n" + "".join(map(_format_paper_entry, enumerate(papers)))
\ No newline at end of file
@@ -1,8 +1,48 @@
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter, Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from itertools import islice
 import re
 from typing import Union, List, Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Each results page holds up to 100 papers.
+_PAGE_SIZE = 100
+# Cap on concurrent page requests against the API.
+_MAX_CONCURRENT_PAGES = 4
+
+# Compiled once; this runs on every by-id lookup.
+_DOI_RE = re.compile(r'(10\.1101/\d{4}\.\d{2}\.\d{2}\.\d+)')
+
+# Shared session so back-to-back API calls reuse pooled TCP/TLS connections
+# instead of paying a fresh handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+def _decode_json(response: requests.Response) -> Dict[str, Any]:
+    """Decode a JSON response, using orjson (C-implemented) when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _fetch_page(server: str, date_interval: str, query: str, cursor: int) -> List[Dict[str, Any]]:
+    """Fetch a single results page at the given cursor offset."""
+    api_url = f"https://api.medrxiv.org/details/{server}/{date_interval}/{cursor}/json"
+    response = _SESSION.get(api_url, params={"term": query})
+    response.raise_for_status()  # Raise exception for HTTP errors
+    return _decode_json(response).get('collection', [])
+
 def fetch_medrxiv_papers(topics: Union[str, List[str]], start_date: str, end_date: str, max_results: int = 100, server: str = "medrxiv") -> List[Dict[str, Any]]:
     """
     Fetch medRxiv papers on specified topics within a given timeframe.
@@ -17,84 +57,72 @@ def fetch_medrxiv_papers(topics: Union[str, List[str]], start_date: str, end_dat
     Returns:
         list: List of dictionaries containing paper details (title, abstract, link)
     """
-    # Convert date strings to datetime objects
-    start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
-    end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
-    
-    # Format dates for API (YYYY-MM-DD)
-    start_date_formatted = start_date_obj.strftime('%Y-%m-%d')
-    end_date_formatted = end_date_obj.strftime('%Y-%m-%d')
-    
-    # Build the query string from topics
-    if isinstance(topics, list):
-        query = " OR ".join(topics)
-    else:
-        # If topics is a string and contains commas, treat it as a list of topics
-        if ',' in topics:
-            topic_list = [t.strip() for t in topics.split(',')]
-            query = " OR ".join(topic_list)
-        else:
-            query = topics
-    
+    # Validate the date strings; they are already in the API's YYYY-MM-DD
+    # format, and fromisoformat is the C fast path compared to strptime
+    date.fromisoformat(start_date)
+    date.fromisoformat(end_date)
+
+    # Build the query string from topics, normalizing a (possibly
+    # comma-separated) string into the list form first
+    if not isinstance(topics, list):
+        topics = [t.strip() for t in topics.split(',')]
+    query = " OR ".join(topics)
+
     # Construct the date interval string (YYYY-MM-DD/YYYY-MM-DD)
-    date_interval = f"{start_date_formatted}/{end_date_formatted}"
+    date_interval = f"{start_date}/{end_date}"
     
     # Results collection
     all_results = []
-    cursor = 0
-    
-    # Paginate through results until we have enough or there are no more
-    while len(all_results) < max_results:
-        # Construct the API URL with the correct format
-        api_url = f"https://api.medrxiv.org/details/{server}/{date_interval}/{cursor}/json"
-        
-        try:
-            # Make the API request
-            response = requests.get(api_url, params={"term": query})
-            response.raise_for_status()  # Raise exception for HTTP errors
-            
-            data = response.json()
-            
-            # Check if we have results
-            collection = data.get('collection', [])
-            if not collection:
-                break
-            
-            # Process the results
-            for paper in collection:
-                # Extract paper details
-                paper_info = {
-                    'title': paper.get('title', ''),
-                    'abstract': paper.get('abstract', ''),
-                    'link': paper.get('pdf_url', '') or f"https://www.{server}.org/content/{paper.get('doi')}.full.pdf",
-                    'published': paper.get('date', ''),
-                    'authors': paper.get('authors', '').split(', ') if isinstance(paper.get('authors', ''), str) else [],
-                    'id': paper.get('doi', ''),
-                    'categories': paper.get('category', []) if isinstance(paper.get('category', []), list) else [paper.get('category', '')]
-                }
-                all_results.append(paper_info)
-                
-                # Stop if we've reached the maximum number of results
-                if len(all_results) >= max_results:
+
+    # The cursor steps are known upfront (100 results per page), so pages
+    # are fetched concurrently — but submitted one window at a time, never
+    # more than _MAX_CONCURRENT_PAGES in flight, so a short page stops the
+    # pagination without ever submitting the remaining cursors.
+    cursors = iter(range(0, max_results, _PAGE_SIZE))
+
+    try:
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_PAGES) as executor:
+            # Pages are consumed in cursor order from the left of the window;
+            # each consumed page tops the window back up with the next cursor
+            window = deque(executor.submit(_fetch_page, server, date_interval, query, cursor)
+                           for cursor in islice(cursors, _MAX_CONCURRENT_PAGES))
+            while window:
+                collection = window.popleft().result()
+                # Process the results
+                for paper in collection:
+                    # Extract paper details
+                    paper_info = {
+                        'title': paper.get('title', ''),
+                        'abstract': paper.get('abstract', ''),
+                        'link': paper.get('pdf_url', '') or f"https://www.{server}.org/content/{paper.get('doi')}.full.pdf",
+                        'published': paper.get('date', ''),
+                        'authors': paper.get('authors', '').split(', ') if isinstance(paper.get('authors', ''), str) else [],
+                        'id': paper.get('doi', ''),
+                        'categories': paper.get('category', []) if isinstance(paper.get('category', []), list) else [paper.get('category', '')]
+                    }
+                    all_results.append(paper_info)
+
+                # A short page means there are no further results
+                if len(collection) < _PAGE_SIZE:
+                    for future in window:
+                        future.cancel()
                     break
-            
-            # Update cursor for next page (each page has 100 results)
-            cursor += 100
-            
-            # If we got fewer than 100 results, there are no more pages
-            if len(collection) < 100:
-                break
-                
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching papers from {server}: {e}")
-            break
-    
+                for cursor in islice(cursors, 1):
+                    window.append(executor.submit(_fetch_page, server, date_interval, query, cursor))
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching papers from {server}: {e}")
+
     return all_results[:max_results]
 
 
+@lru_cache(maxsize=2048)
 def fetch_medrxiv_paper_by_id(paper_id: str, server: str = "medrxiv") -> Optional[Dict[str, Any]]:
     """
     Fetch a single medRxiv paper by its ID (DOI).
+
+    Results are memoized: paper metadata is effectively immutable, so
+    repeated lookups of the same ID skip the network round-trip.
     
     Args:
         paper_id (str): medRxiv paper DOI or ID
@@ -109,7 +137,7 @@ def fetch_medrxiv_paper_by_id(paper_id: str, server: str = "medrxiv") -> Optiona
         doi = paper_id
     # If it contains the DOI pattern, extract it
     elif '10.1101/' in paper_id:
-        match = re.search(r'(10\.1101/\d{4}\.\d{2}\.\d{2}\.\d+)', paper_id)
+        match = _DOI_RE.search(paper_id)
         if match:
             doi = match.group(1)
         else:
@@ -123,14 +151,14 @@ def fetch_medrxiv_paper_by_id(paper_id: str, server: str = "medrxiv") -> Optiona
     
     try:
         # Make the API request
-        response = requests.get(api_url)
+        response = _SESSION.get(api_url)
         
         # Check if the request was successful
         if response.status_code != 200:
             print(f"Error: API returned status code {response.status_code}")
             return None
         
-        data = response.json()
+        data = _decode_json(response)
         
         # Debug the response
         if 'collection' not in data or not data['collection']:
@@ -1,21 +1,57 @@
+import asyncio
+import functools
 import logging
 import os
 import json
-import pytz                                
+import re
+from collections import deque
+from time import monotonic
+from zoneinfo import ZoneInfo
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime, time, timedelta
 from telegram import Update, Bot
 from telegram.ext import Application, CommandHandler, CallbackContext, ContextTypes, MessageHandler, filters
+from telegram.request import HTTPXRequest
 
-from arxiv_api import fetch_arxiv_papers
-from helpers import escape_html, chunk_html_message, paper_id_with_dot, format_papers
+from arxiv_api import fetch_arxiv_papers, fetch_paper_by_id
+from helpers import (chunk_html_message, fits_in_telegram_message,
+                     iter_html_chunks, paper_id_with_dot, format_papers)
+# Not used in this module, but re-exported on purpose: test_telegram_bot.py
+# imports them from telegram_bot rather than helpers.
+from helpers import paper_id_without_dot, telegram_len  # noqa: F401
+
+# Static reply texts, built once at import time
+_UNAUTHORIZED_TEXT = 'You are not authorized to use this bot.'
+_START_TEXT = (
+    'Hi! I am your ArXiv Paper Bot. I will send you daily updates of papers on your topics of interest.\n\n'
+    'Use /help to see available commands.'
+)
+_HELP_TEXT = (
+    'Available commands:\n\n'
+    '/topics - Show current topics\n'
+    '/add_topic <topic> - Add a new topic (e.g., cs.CV, cs.AI)\n'
+    '/remove_topic <topic> - Remove a topic\n'
+    '/set_time HH:MM - Set notification time (24h format)\n'
+    '/set_timezone <timezone> - Set timezone (e.g., UTC, US/Eastern)\n'
+    '/today - Get today\'s papers now\n'
+    '/abstract <paper_id> - Show full abstract of a paper by its arXiv ID\n'
+    '/authorize <user_id> - Authorize a new user (admin only)\n'
+    '/help - Show this help message'
+)
 
 def authorized_only(func):
     """Decorator to check if user is authorized to use the bot."""
+    @functools.wraps(func)
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
         user_id = update.effective_user.id
-        if user_id not in config['authorized_users']:
-            await update.message.reply_text('You are not authorized to use this bot.')
-            logger.warning(f"Unauthorized access attempt by user {user_id}")
+        if user_id not in _authorized_set:
+            await update.message.reply_text(_UNAUTHORIZED_TEXT)
+            # lazy %s formatting: only rendered if the record is emitted
+            logger.warning("Unauthorized access attempt by user %s", user_id)
             return
         return await func(update, context, *args, **kwargs)
     return wrapper
@@ -37,28 +73,114 @@ def load_config():
             "authorized_users": [],
             "topics": ["cs.CV", "cs.AI"],
             "notification_time": "09:00",
-            "timezone": "UTC"
+            "timezone": "UTC",
+            "webhook_url": ""
         }
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        save_config(default_config)
         return default_config
-    
-    with open(CONFIG_FILE, 'r') as f:
-        return json.load(f)
+
+    with open(CONFIG_FILE, 'rb') as f:
+        data = f.read()
+    # orjson parses the blob noticeably faster than stdlib json when present
+    cfg = orjson.loads(data) if orjson is not None else json.loads(data)
+    # Telegram user IDs are ints; normalize legacy string entries once here
+    # so membership checks never compare across types
+    cfg['authorized_users'] = [int(u) for u in cfg.get('authorized_users', [])]
+    return cfg
 
 def save_config(config):
-    """Save configuration to JSON file"""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    """Save configuration to JSON file atomically.
+
+    Writes to a temp file and renames it over the config, so a crash
+    mid-write can never leave a truncated config.json behind (which
+    would drop the authorized-user list on the next load).
+    """
+    tmp = CONFIG_FILE + '.tmp'
+    if orjson is not None:
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp, 'w') as f:
+            json.dump(config, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_FILE)
+
+# Handle to the pending debounced config flush, if any, plus a dirty flag
+# so a mutation landing while a flush is mid-write is never lost
+_save_task = None
+_config_dirty = False
+_SAVE_DELAY = 2.0
+
+def schedule_save():
+    """Persist the in-memory config soon, coalescing bursts of mutations.
+
+    The module-global config dict is authoritative at runtime; the file
+    write is debounced and runs on a worker thread so command handlers
+    never block the event loop on disk I/O.
+    """
+    global _save_task, _config_dirty
+    _config_dirty = True
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No running event loop (sync caller): write immediately
+        _config_dirty = False
+        save_config(config)
+        return
+    if _save_task is None or _save_task.done():
+        _save_task = loop.create_task(_flush_config_later())
+
+async def _flush_config_later():
+    # Loop until no mutation arrived during the write: clearing the flag
+    # before writing means a schedule_save() racing the to_thread call
+    # re-marks it and triggers another pass instead of being dropped
+    global _config_dirty
+    while _config_dirty:
+        await asyncio.sleep(_SAVE_DELAY)
+        _config_dirty = False
+        await asyncio.to_thread(save_config, config)
+
+async def _flush_config_on_shutdown(application):
+    """post_shutdown hook: persist any change still inside the debounce window."""
+    global _config_dirty
+    if _save_task is not None:
+        _save_task.cancel()
+    if _config_dirty:
+        _config_dirty = False
+        save_config(config)
 
 # Load configuration
 config = load_config()
 
+# Hashed view of authorized_users for the per-update membership check;
+# the JSON file keeps the list form (int-normalized by load_config).
+# Kept in sync by authorize_user.
+_authorized_set = set(config['authorized_users'])
+
+# Same idea for topics: the list keeps its JSON order for display, the set
+# answers the duplicate checks in add_topic/remove_topic.
+_topics_set = set(config['topics'])
+
+# Resolved timezone object, cached so handlers don't re-parse the tz
+# database on every call. Kept in sync by set_timezone.
+_timezone = ZoneInfo(config['timezone'])
+
+# Parsed notification time, kept in sync by set_time so the scheduler
+# never re-splits the HH:MM string
+_notification_time = time(*map(int, config['notification_time'].split(':')))
+
+def get_timezone():
+    """Return the cached timezone object for the configured timezone."""
+    return _timezone
+
 # Check if there's a token in the config that needs to be migrated
 if 'token' in config:
     if not os.environ.get('TELEGRAM_BOT_TOKEN'):
         logger.warning("Token found in config.json. Please set it as TELEGRAM_BOT_TOKEN environment variable instead.")
-        logger.warning(f"You can set it with: export TELEGRAM_BOT_TOKEN='{config['token']}'")
+        logger.warning("You can set it with: export TELEGRAM_BOT_TOKEN='%s'", config['token'])
     # Remove token from config
     #del config['token']
     #save_config(config)
@@ -67,31 +189,22 @@ if 'token' in config:
 @authorized_only
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send a message when the command /start is issued."""
-    await update.message.reply_text(
-        'Hi! I am your ArXiv Paper Bot. I will send you daily updates of papers on your topics of interest.\n\n'
-        'Use /help to see available commands.'
-    )
+    await update.message.reply_text(_START_TEXT)
 
 @authorized_only
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send a message when the command /help is issued."""
-    await update.message.reply_text(
-        'Available commands:\n\n'
-        '/topics - Show current topics\n'
-        '/add_topic <topic> - Add a new topic (e.g., cs.CV, cs.AI)\n'
-        '/remove_topic <topic> - Remove a topic\n'
-        '/set_time HH:MM - Set notification time (24h format)\n'
-        '/set_timezone <timezone> - Set timezone (e.g., UTC, US/Eastern)\n'
-        '/today - Get today\'s papers now\n'
-        '/abstract <paper_id> - Show full abstract of a paper by its arXiv ID\n'
-        '/authorize <user_id> - Authorize a new user (admin only)\n'
-        '/help - Show this help message'
-    )
+    await update.message.reply_text(_HELP_TEXT)
 
 @authorized_only
 async def topics_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show current topics."""
-    topics_text = "Current topics:\n\n" + "\n".join([f"- {topic}" for topic in config['topics']])
+    # Join with the bullet in the separator: no per-topic f-string and no
+    # throwaway list
+    if config['topics']:
+        topics_text = "Current topics:\n\n- " + "\n- ".join(config['topics'])
+    else:
+        topics_text = "Current topics:\n\n"
     await update.message.reply_text(topics_text)
 
 @authorized_only
@@ -102,12 +215,13 @@ async def add_topic(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
     
     topic = context.args[0]
-    if topic in config['topics']:
+    if topic in _topics_set:
         await update.message.reply_text(f'Topic "{topic}" already exists.')
         return
-    
+
     config['topics'].append(topic)
-    save_config(config)
+    _topics_set.add(topic)
+    schedule_save()
     await update.message.reply_text(f'Added topic: {topic}')
 
 @authorized_only
@@ -118,30 +232,49 @@ async def remove_topic(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         return
     
     topic = context.args[0]
-    if topic not in config['topics']:
+    if topic not in _topics_set:
         await update.message.reply_text(f'Topic "{topic}" does not exist.')
         return
-    
+
     config['topics'].remove(topic)
-    save_config(config)
+    _topics_set.discard(topic)
+    schedule_save()
     await update.message.reply_text(f'Removed topic: {topic}')
 
+# Valid HH:MM (24h) notification times; cheaper than a strptime round-trip
+_TIME_RE = re.compile(r'^([01]\d|2[0-3]):([0-5]\d)$')
+
 @authorized_only
 async def set_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Set notification time."""
     if not context.args or len(context.args) != 1:
         await update.message.reply_text('Please provide time in HH:MM format.')
         return
-    
+
+    global _notification_time
     time_str = context.args[0]
-    try:
-        # Validate time format
-        datetime.strptime(time_str, '%H:%M')
-        config['notification_time'] = time_str
-        save_config(config)
-        await update.message.reply_text(f'Notification time set to {time_str}')
-    except ValueError:
+    m = _TIME_RE.match(time_str)
+    if not m:
         await update.message.reply_text('Invalid time format. Please use HH:MM (24h format).')
+        return
+
+    _notification_time = time(int(m.group(1)), int(m.group(2)))
+    config['notification_time'] = time_str
+    schedule_save()
+    if context.job_queue:
+        _schedule_daily_job(context.job_queue)
+    await update.message.reply_text(f'Notification time set to {time_str}')
+
+# All valid tz keys, built once on the first /set_timezone; scanning the
+# tzdata directories is too slow to repeat per command
+_valid_timezones = None
+
+def _known_timezones():
+    global _valid_timezones
+    if _valid_timezones is None:
+        import zoneinfo
+        _valid_timezones = frozenset(zoneinfo.available_timezones())
+    return _valid_timezones
 
 @authorized_only
 async def set_timezone(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -149,55 +282,91 @@ async def set_timezone(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     if not context.args:
         await update.message.reply_text('Please provide a timezone (e.g., UTC, US/Eastern).')
         return
-    
+
+    global _timezone
     timezone = ' '.join(context.args)
-    try:
-        pytz.timezone(timezone)
-        config['timezone'] = timezone
-        save_config(config)
-        await update.message.reply_text(f'Timezone set to {timezone}')
-    except pytz.exceptions.UnknownTimeZoneError:
+    if timezone not in _known_timezones():
         await update.message.reply_text(f'Unknown timezone: {timezone}. Please provide a valid timezone.')
+        return
+
+    _timezone = ZoneInfo(timezone)
+    config['timezone'] = timezone
+    schedule_save()
+    if context.job_queue:
+        _schedule_daily_job(context.job_queue)
+    await update.message.reply_text(f'Timezone set to {timezone}')
+
+# References to in-flight fire-and-forget sends so the tasks aren't
+# garbage collected before completing
+_background_tasks = set()
+
+def _discard_and_log(task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background send failed: %s", task.exception())
+
+def fire_and_forget(coro):
+    """Run a send in the background, logging (not raising) any failure."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_discard_and_log)
+
+# Memo of the last formatted digest, keyed by topics and local date, so the
+# scheduled broadcast and /today calls on the same day share one fetch+format.
+# Entries expire after a short TTL: new papers keep appearing through the day,
+# so a morning digest must not be served verbatim until midnight.
+_digest_cache = {}
+_DIGEST_TTL = 1800
+
+async def get_daily_digest():
+    """Fetch and format today's paper digest, memoized per (topics, day).
+
+    Returns:
+        str: The formatted digest message, or None when no papers matched.
+    """
+    # Aware "now" in the configured timezone so the day boundary matches
+    # what subscribers expect
+    now = datetime.now(get_timezone())
+    yesterday = now - timedelta(days=1)
+
+    key = (tuple(config['topics']), now.date())
+    cached = _digest_cache.get(key)
+    if cached is not None and monotonic() < cached[0]:
+        return cached[1]
+
+    # Run the blocking fetch on a worker thread so the event loop keeps
+    # serving other handlers during the HTTP round-trips
+    papers = await asyncio.to_thread(fetch_arxiv_papers, config['topics'], yesterday, now)
+    message = format_papers(papers) if papers else None
+
+    # Only the current day's digest is worth keeping around; an empty
+    # result is never memoized, so the next call (e.g. the scheduled
+    # broadcast) retries the fetch instead of repeating "no papers"
+    _digest_cache.clear()
+    if message is not None:
+        _digest_cache[key] = (monotonic() + _DIGEST_TTL, message)
+    return message
 
 @authorized_only
 async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Get today's papers."""
-    await update.message.reply_text('Searching for today\'s papers, please wait...')
-    
-    now = datetime.now()
-    yesterday = now - timedelta(days=1)
-    
+    # Don't await the ack: the fetch starts immediately and the ack's
+    # round-trip overlaps it
+    fire_and_forget(update.message.reply_text('Searching for today\'s papers, please wait...'))
+
     try:
-        papers = fetch_arxiv_papers(config['topics'], yesterday, now)
+        message = await get_daily_digest()
     except Exception as e:
-        logger.error(f"Error fetching papers: {e}")
+        logger.error("Error fetching papers: %s", e)
         await update.message.reply_text(f"An error occurred: {str(e)}")
         return
-    
-    if not papers:
+
+    if message is None:
         await update.message.reply_text("No papers found today for your topics.")
         return
 
-    message = format_papers(papers)
-
-    # Split message if it's too long
-    if len(message) <= 4096:
-        await update.message.reply_text(message, parse_mode='HTML')
-    else:
-        # Use the smart chunking function
-        chunks = chunk_html_message(message)
-        for chunk in chunks:
-            try:
-                await update.message.reply_text(chunk, parse_mode='HTML')
-            except Exception as e:
-                logger.error(f"Error sending message chunk: {e}")
-                # Try sending without HTML parsing as fallback
-                try:
-                    await update.message.reply_text(
-                        f"Could not send formatted message due to an error. Here's the plain text:\n\n{chunk}",
-                        parse_mode=None)
-                except Exception as inner_e:
-                    logger.error(f"Failed to send even plain text message: {inner_e}")
+    # Same chunking/fallback path as the daily broadcast
+    await send_message_to_user(context.bot, message, update.effective_chat.id)
 
 @authorized_only
 async def authorize_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -208,222 +377,241 @@ async def authorize_user(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     try:
         new_user_id = int(context.args[0])
-        if new_user_id in config['authorized_users']:
+        if new_user_id in _authorized_set:
             await update.message.reply_text(f'User {new_user_id} is already authorized.')
             return
-        
-        config['authorized_users'].append(str(new_user_id))
-        save_config(config)
+
+        config['authorized_users'].append(new_user_id)
+        _authorized_set.add(new_user_id)
+        schedule_save()
         await update.message.reply_text(f'User {new_user_id} has been authorized.')
     except ValueError:
         await update.message.reply_text('Invalid user ID. Please provide a numeric ID.')
 
+# Matches both '/abstract 2101.12345' and the attached '/abstract210112345'
+# form, capturing the ID directly so handlers don't re-slice the text
+_ABSTRACT_RE = re.compile(r'^/abstract(?:@\w+)?\s*([0-9v.]+)')
+
+# Reply layout for a single paper, built once at import time
+_ABSTRACT_TMPL = (
+    "📄 <b>{title}</b>\n\n"
+    "👥 <b>Authors:</b> {authors}\n\n"
+    "📅 <b>Published:</b> {published}\n"
+    "🏷️ <b>Categories:</b> {categories}\n"
+    "🔗 <a href=\"{link}\">PDF Link</a>\n\n"
+    "📝 <b>Abstract:</b>\n{abstract}"
+)
+
 @authorized_only
 async def paper_abstract(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Get full abstract of a paper by its arXiv ID."""
-    if not context.args or len(context.args) < 1:
+    m = _ABSTRACT_RE.match(update.message.text)
+    paper_id = m.group(1) if m else (context.args[0] if context.args else None)
+    if not paper_id:
         await update.message.reply_text('Please provide an arXiv paper ID (e.g., /abstract 2101.12345)')
         return
-    
-    paper_id = paper_id_with_dot(context.args[0])
-    await update.message.reply_text(f'Searching for paper with ID: {paper_id}...')
-    
-    try:
-        from arxiv_api import fetch_paper_by_id
-        paper = fetch_paper_by_id(paper_id)
-        
-        if not paper:
-            await update.message.reply_text(f'No paper found with ID: {paper_id}')
-            return
-        
-        # Format the paper details
-        title = escape_html(paper['title'])
-        authors = ', '.join([escape_html(author) for author in paper['authors']])
-        abstract = escape_html(paper['abstract'])
-        categories = ', '.join(paper['categories']) if 'categories' in paper else 'N/A'
-        published = paper['published']
-        link = paper['link']
-        
-        message = (
-            f"📄 <b>{title}</b>\n\n"
-            f"👥 <b>Authors:</b> {authors}\n\n"
-            f"📅 <b>Published:</b> {published}\n"
-            f"🏷️ <b>Categories:</b> {categories}\n"
-            f"🔗 <a href=\"{link}\">PDF Link</a>\n\n"
-            f"📝 <b>Abstract:</b>\n{abstract}"
-        )
-        
-        # Split message if it's too long
-        if len(message) <= 4096:
-            await update.message.reply_text(message, parse_mode='HTML')
-        else:
-            chunks = chunk_html_message(message)
-            for chunk in chunks:
-                try:
-                    await update.message.reply_text(chunk, parse_mode='HTML')
-                except Exception as e:
-                    logger.error(f"Error sending message chunk: {e}")
-                    await update.message.reply_text(f"Error formatting message. Here's the plain text portion:\n\n{chunk[:3000]}")
-    
-    except Exception as e:
-        logger.error(f"Error fetching paper with ID {paper_id}: {e}")
-        await update.message.reply_text(f"An error occurred while fetching the paper: {str(e)}")
 
+    paper_id = paper_id_with_dot(paper_id)
+    fire_and_forget(update.message.reply_text(f'Searching for paper with ID: {paper_id}...'))
 
-@authorized_only
-async def abstract_no_space(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle /abstractXXXXX commands where the ID is attached to the command."""
-    # Extract paper ID from the command text
-    command_text = update.message.text
-    # Skip '/abstract' part and get the remaining text as paper_id
-    paper_id = paper_id_with_dot(command_text[9:].strip())
-    
-    if not paper_id:
-        await update.message.reply_text('Please provide an arXiv paper ID (e.g., /abstract 2101.12345)')
-        return
-    
-    await update.message.reply_text(f'Searching for paper with ID: {paper_id}...')
-    
     try:
-        from arxiv_api import fetch_paper_by_id
-        paper = fetch_paper_by_id(paper_id)
-        
+        paper = await asyncio.to_thread(fetch_paper_by_id, paper_id)
+
         if not paper:
             await update.message.reply_text(f'No paper found with ID: {paper_id}')
             return
-        
-        # Format the paper details
-        title = escape_html(paper['title'])
-        authors = ', '.join([escape_html(author) for author in paper['authors']])
-        abstract = escape_html(paper['abstract'])
-        categories = ', '.join(paper['categories']) if 'categories' in paper else 'N/A'
-        published = paper['published']
-        link = paper['link']
-        
-        message = (
-            f"📄 <b>{title}</b>\n\n"
-            f"👥 <b>Authors:</b> {authors}\n\n"
-            f"📅 <b>Published:</b> {published}\n"
-            f"🏷️ <b>Categories:</b> {categories}\n"
-            f"🔗 <a href=\"{link}\">PDF Link</a>\n\n"
-            f"📝 <b>Abstract:</b>\n{abstract}"
+
+        # Format the paper details; the *_html fields arrive pre-escaped
+        # (and cached) from arxiv_api
+        message = _ABSTRACT_TMPL.format(
+            title=paper['title_html'],
+            authors=paper['authors_html'],
+            published=paper['published'],
+            categories=', '.join(paper['categories']) if 'categories' in paper else 'N/A',
+            link=paper['link'],
+            abstract=paper['abstract_html'],
         )
-        
-        # Split message if it's too long
-        if len(message) <= 4096:
+
+        # Split message if it's too long (Telegram counts UTF-16 units)
+        if fits_in_telegram_message(message):
             await update.message.reply_text(message, parse_mode='HTML')
         else:
-            chunks = chunk_html_message(message)
-            for chunk in chunks:
+            # Stream the chunks so only one is alive at a time
+            for chunk in iter_html_chunks(message):
                 try:
                     await update.message.reply_text(chunk, parse_mode='HTML')
                 except Exception as e:
-                    logger.error(f"Error sending message chunk: {e}")
+                    logger.error("Error sending message chunk: %s", e)
                     await update.message.reply_text(f"Error formatting message. Here's the plain text portion:\n\n{chunk[:3000]}")
-    
+
     except Exception as e:
-        logger.error(f"Error fetching paper with ID {paper_id}: {e}")
+        logger.error("Error fetching paper with ID %s: %s", paper_id, e)
         await update.message.reply_text(f"An error occurred while fetching the paper: {str(e)}")
 
 
 async def send_daily_papers(context: CallbackContext) -> None:
     """Send daily papers to all authorized users."""
-    # Fetch all papers for all topics in one go
-    now = datetime.now()
-    yesterday = now - timedelta(days=1)
-
     try:
-        papers = fetch_arxiv_papers(config['topics'], yesterday, now)
+        message = await get_daily_digest()
     except Exception as e:
-        logger.error(f"Error fetching papers: {e}")
-        message = f"An error occurred: {str(e)}"
-        for user_id in config['authorized_users']:
-            await send_message_to_user(context.bot, message, user_id)
-        return 
-
-    if not papers:
-        message = "No papers found today for your topics."
-        for user_id in config['authorized_users']:
-            await send_message_to_user(context.bot, message, user_id)
+        logger.error("Error fetching papers: %s", e)
+        await broadcast_message(context.bot, f"An error occurred: {str(e)}")
+        return
+
+    if message is None:
+        await broadcast_message(context.bot, "No papers found today for your topics.")
         return
 
-    message = format_papers(papers)   
     # Send to all authorized users
-    for user_id in config['authorized_users']:
-        await send_message_to_user(context.bot, message, user_id)
+    await broadcast_message(context.bot, message)
+
+# Bound on concurrent sends, kept under Telegram's ~30 msg/s bot-wide limit
+_BROADCAST_CONCURRENCY = 25
+
+# Messages allowed to start per sliding one-second window; the semaphore
+# alone caps concurrency but not the rate at which sends are issued
+_SEND_RATE = 25
+_send_times = deque()
+
+async def _acquire_send_slot():
+    """Wait until starting another send stays within the per-second rate."""
+    while True:
+        now = monotonic()
+        while _send_times and now - _send_times[0] >= 1.0:
+            _send_times.popleft()
+        if len(_send_times) < _SEND_RATE:
+            _send_times.append(now)
+            return
+        await asyncio.sleep(1.0 - (now - _send_times[0]))
+
+async def broadcast_message(bot: Bot, message: str):
+    """Send a message to all authorized users concurrently."""
+    semaphore = asyncio.Semaphore(_BROADCAST_CONCURRENCY)
+    # Chunk once up front; the split is identical for every recipient
+    chunks = _split_message(message)
+
+    async def send(user_id):
+        async with semaphore:
+            await send_chunks_to_user(bot, chunks, user_id)
+
+    # send_chunks_to_user handles its own errors, so one failed user
+    # cannot cancel the rest of the fan-out
+    await asyncio.gather(*(send(user_id) for user_id in config['authorized_users']))
+
+def _split_message(message: str) -> list[str]:
+    """Split a message into Telegram-sized chunks (usually just one)."""
+    if fits_in_telegram_message(message):
+        return [message]
+    # Use the smart chunking function
+    return chunk_html_message(message)
 
 async def send_message_to_user(bot: Bot, message: str, user_id: str):
+    await send_chunks_to_user(bot, _split_message(message), user_id)
+
+async def send_chunks_to_user(bot: Bot, chunks: list[str], user_id: str):
     try:
-        if len(message) <= 4096:
-            await bot.send_message(
-                chat_id=user_id,
-                text=message,
-                parse_mode='HTML'
-            )
-        else:
-            # Use the smart chunking function
-            chunks = chunk_html_message(message)
-            for chunk in chunks:
+        last = len(chunks) - 1
+        for n, chunk in enumerate(chunks):
+            await _acquire_send_slot()
+            try:
+                # Sends stay sequential so chunk order is guaranteed, but
+                # only the final chunk rings the recipient's device
+                await bot.send_message(
+                    chat_id=user_id,
+                    text=chunk,
+                    parse_mode='HTML',
+                    disable_notification=n != last
+                )
+            except Exception as e:
+                logger.error("Error sending message chunk: %s", e)
+                # Try sending without HTML parsing as fallback
                 try:
                     await bot.send_message(
                         chat_id=user_id,
-                        text=chunk,
-                        parse_mode='HTML'
+                        text=f"Could not send formatted message due to an error. Here's the plain text:\n\n{chunk}",
+                        parse_mode=None
                     )
-                except Exception as e:
-                    logger.error(f"Error sending message chunk: {e}")
-                    # Try sending without HTML parsing as fallback
-                    try:
-                        await bot.send_message(
-                            chat_id=user_id,
-                            text=f"Could not send formatted message due to an error. Here's the plain text:\n\n{chunk}",
-                            parse_mode=None
-                        )
-                    except Exception as inner_e:
-                        logger.error(f"Failed to send even plain text message: {inner_e}")
+                except Exception as inner_e:
+                    logger.error("Failed to send even plain text message: %s", inner_e)
     except Exception as e:
-        logger.error(f"Error sending message to user {user_id}: {e}")
+        logger.error("Error sending message to user %s: %s", user_id, e)
 
 
+# Command name -> handler, registered in run_bot in declaration order
+_COMMAND_HANDLERS = (
+    ("start", start),
+    ("help", help_command),
+    ("topics", topics_command),
+    ("add_topic", add_topic),
+    ("remove_topic", remove_topic),
+    ("set_time", set_time),
+    ("set_timezone", set_timezone),
+    ("today", today_command),
+    ("abstract", paper_abstract),
+    ("authorize", authorize_user),
+)
+
+# Handle to the scheduled daily job so settings changes can replace it
+_daily_job = None
+
+def _schedule_daily_job(job_queue):
+    """(Re)schedule the daily paper job from the current config."""
+    global _daily_job
+    if _daily_job is not None:
+        _daily_job.schedule_removal()
+    _daily_job = job_queue.run_daily(
+        send_daily_papers,
+        time=_notification_time.replace(tzinfo=get_timezone()),
+    )
+
 def run_bot():
     """Run the bot."""
-    # Get token from environment variable
-    token = os.environ.get("TELEGRAM_BOT_TOKEN")
-    
+    # Prefer the environment variable; fall back to a token still living
+    # in config.json from before the migration
+    token = os.environ.get("TELEGRAM_BOT_TOKEN") or config.get('token')
+
     if not token:
         logger.error("No token provided. Please set the TELEGRAM_BOT_TOKEN environment variable.")
-    
-    # Create the Application with job_queue explicitly enabled
-    application = Application.builder().token(config['token']).build()
-    
+        return
+
+    # Create the Application with job_queue explicitly enabled. Size the
+    # httpx connection pool for the concurrent broadcast sends so bursts
+    # reuse warm TLS connections instead of queueing on the default pool.
+    request = HTTPXRequest(connection_pool_size=_BROADCAST_CONCURRENCY + 4, pool_timeout=5)
+    # post_shutdown flushes a config change still sitting in the debounce
+    # window, so stopping the bot right after e.g. /authorize can't lose it
+    application = (Application.builder()
+                   .token(token)
+                   .request(request)
+                   .post_shutdown(_flush_config_on_shutdown)
+                   .build())
+
+    # Expose the (shared) config dict through bot_data so job callbacks
+    # and handlers can reach it via context instead of the module global
+    application.bot_data['config'] = config
+
     # Add command handlers
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("topics", topics_command))
-    application.add_handler(CommandHandler("add_topic", add_topic))
-    application.add_handler(CommandHandler("remove_topic", remove_topic))
-    application.add_handler(CommandHandler("set_time", set_time))
-    application.add_handler(CommandHandler("set_timezone", set_timezone))
-    application.add_handler(CommandHandler("today", today_command))
-    application.add_handler(CommandHandler("abstract", paper_abstract))
-    application.add_handler(CommandHandler("authorize", authorize_user))
-    application.add_handler(MessageHandler(filters.Regex(r'^/abstract[0-9v\.]+'), abstract_no_space))
-    
-    # Set up job queue for daily notifications
-    job_queue = application.job_queue
-    
-    # Parse notification time
-    hour, minute = map(int, config['notification_time'].split(':'))
-    tz = pytz.timezone(config['timezone'])
+    for command, handler in _COMMAND_HANDLERS:
+        application.add_handler(CommandHandler(command, handler))
+    # COMMAND short-circuits on the entity flag, so ordinary messages never
+    # reach the regex at all
+    application.add_handler(MessageHandler(filters.COMMAND & filters.Regex(_ABSTRACT_RE), paper_abstract))
     
     # Schedule daily paper updates
-    job_queue.run_daily(
-        send_daily_papers,
-        time=time(hour=hour, minute=minute),
-    )
+    _schedule_daily_job(application.job_queue)
+
+
+    # Start the Bot. With a webhook URL configured Telegram pushes updates
+    # to us, avoiding the idle long-poll cycle; otherwise fall back to polling.
+    if config.get('webhook_url'):
+        application.run_webhook(
+            listen='0.0.0.0',
+            port=config.get('webhook_port', 8443),
+            url_path=token,
+            webhook_url=f"{config['webhook_url'].rstrip('/')}/{token}",
+            secret_token=config.get('webhook_secret'),
+        )
+    else:
+        application.run_polling()
 
-    
-    # Start the Bot
-    application.run_polling()
-    
     logger.info("Bot started!")
@@ -3,7 +3,6 @@ import asyncio
 import json
 import os
 from datetime import datetime, time
-import pytz
 from unittest.mock import patch, MagicMock
 from telegram.ext import Application, JobQueue
 import telegram_bot
@@ -155,9 +154,11 @@ class TestJobQueue(unittest.TestCase):
             
             # Call the function
             result = load_config()
-            
-            # Verify the result matches our mock config
-            self.assertEqual(result, self.mock_config)
+
+            # Verify the result matches our mock config, with the string
+            # user IDs normalized to ints on load
+            expected = dict(self.mock_config, authorized_users=[123456, 789012])
+            self.assertEqual(result, expected)
             
         finally:
             # Clean up and restore original config file path
@@ -181,6 +182,14 @@ class TestJobQueue(unittest.TestCase):
         combined = "\n\n".join(chunks)
         self.assertEqual(combined.replace("\n\n\n\n", "\n\n"), long_message)
     
+    def test_telegram_len(self):
+        # ASCII counts one unit per character
+        self.assertEqual(telegram_bot.telegram_len("hello"), 5)
+
+        # Emoji outside the BMP count as two UTF-16 units
+        self.assertEqual(telegram_bot.telegram_len("📚"), 2)
+        self.assertEqual(telegram_bot.telegram_len("a📚b"), 4)
+
     def test_paper_id_without_dot(self):
         # Test ID with dot
         self.assertEqual(paper_id_without_dot("2401.12345"), "240112345")